@@ -7,8 +7,6 @@ import argparse
 import os
 import sys
 
-from core.context_file import ContextFile
-from core.llms.base_llm import BaseModel
 import functions as func
 from config import ProgramConfig, ProgramSetting
 from core import ChatRoles, OllamaModel
@@ -155,22 +153,6 @@ class CliArgs:
                     f"Filename: {args.file} \n  File Content:\n```{text_file}```",
                 )
 
-    def _has_image(self, prog, args):
-        """
-        Checks if the user wants to load image or images.
-
-        :param prog: The program object.
-        :param args: The CLI arguments.
-        """
-
-        if args.image:
-            files = args.image.split(",")
-            for file in files:
-                if os.path.exists(file):
-                    prog.chat.images.append(file)
-                else:
-                    raise FileNotFoundError(file)
-
     def _has_task_file(self, args):
         """
         Checks if the user has provided a task file.
@@ -191,15 +173,18 @@ class CliArgs:
         """
 
         if args.task:
+            template_filename = args.task.removesuffix(".md") + ".md"
+            user_tasks_dir = ProgramConfig.current.config["USER_PATHS"]["TASKS_TEMPLATES"]
+
             filename = os.path.join(
-                ProgramConfig.current.config["USER_PATHS"]["TASKS_TEMPLATES"],
-                args.task.replace(".md", "") + ".md",
+                ProgramConfig.current.config["PATHS"]["TASKS_TEMPLATES"],
+                template_filename,
             )
-            if not os.path.exists(filename):
-                filename = os.path.join(
-                    ProgramConfig.current.config["PATHS"]["TASKS_TEMPLATES"],
-                    args.task.replace(".md", "") + ".md",
-                )
+            # an empty user folder would resolve the template against the working directory
+            if user_tasks_dir:
+                user_filename = os.path.join(user_tasks_dir, template_filename)
+                if func.template_exists(user_filename):
+                    filename = user_filename
             task = func.read_file(filename)
             args.msg = task
 
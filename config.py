@@ -1,13 +1,43 @@
 
+import copy
 import json
 import logging
 import os
 from os.path import exists,dirname
-import pathlib
 
 from typing import TypeVar, Generic
 T = TypeVar('T')
 
+try:
+    # faster parser, listed in requirements.txt, stdlib json is used when missing
+    import orjson
+except ImportError:
+    orjson = None
+
+# parsed config files, keyed by filename with the (mtime, size) they were parsed at
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
+def _deep_update(target:dict, overrides:dict) -> dict:
+    """
+    Updates target with overrides in place, merging nested dicts key by key instead of replacing them.
+
+    Args:
+        target (dict): The dict to update.
+        overrides (dict): The values to apply on top of target.
+
+    Example:
+        >>> _deep_update({'PATHS': {'a': 1, 'b': 2}}, {'PATHS': {'b': 3}})
+            # Returns {'PATHS': {'a': 1, 'b': 3}}
+    """
+    for key, value in overrides.items():
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _deep_update(current, value)
+        else:
+            target[key] = value
+    return target
+
 class ProgramSetting:
     MODEL_NAME = "MODEL_NAME"
     SYSTEM_PROMPT_FILE = "SYSTEM_PROMPT_FILE"
@@ -37,23 +67,38 @@ class ProgramConfig(Generic[T]):
         user_config_filename: str = os.environ.get('AI_ASSISTANT_CONFIG_FILENAME')
         if user_config_filename and exists(path=user_config_filename):
             user_config = self.__load_to_dict(user_config_filename)
-            default_config.update(**user_config)
+            # a partial PATHS section in the user file must not drop the other default paths
+            _deep_update(default_config, user_config)
         self.config = default_config 
 
     
     def __load_to_dict(self, filename:str) -> dict:  
-        if not exists(path=filename):
+        try:
+            file_stat = os.stat(filename)
+        except FileNotFoundError:
             self.logger.level = logging.ERROR
-            self.logger.error("Configuration file not found.", filename)
+            self.logger.error("Configuration file not found: %s", filename)
             return None
-        
-        with open(filename) as f:
-            text_content:str = pathlib.Path(filename).read_text().replace("{root_dir}",dirname(__file__)).replace(os.path.sep,"/")
-            dict_data:str = json.loads(text_content)
-            return dict_data
+
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = _CONFIG_CACHE.get(filename)
+        if cached and cached[0] == file_version:
+            # callers mutate the loaded dict, so never hand out the cached one
+            return copy.deepcopy(cached[1])
+
+        # the stat above already gives the size, read it in one go
+        with open(filename, 'rb') as f:
+            text_content:str = f.read(file_stat.st_size).decode("utf-8").replace("{root_dir}",dirname(__file__)).replace(os.path.sep,"/")
+        dict_data:dict = orjson.loads(text_content) if orjson else json.loads(text_content)
+        _CONFIG_CACHE[filename] = (file_version, dict_data)
+        return copy.deepcopy(dict_data)
 
     def get(self, key:str, default_value:T=None) -> T:
-        return ProgramConfig.current.config.get(key, default_value)    
+        return ProgramConfig.current.config.get(key, default_value)
+
+    def get_many(self, keys:list[str], default_value:T=None) -> tuple:
+        config_get = ProgramConfig.current.config.get
+        return tuple(config_get(key, default_value) for key in keys)
 
     def set(self,key:str,value=None) -> None:
         ProgramConfig.current.config[key] = value
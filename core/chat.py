@@ -53,13 +53,16 @@ class Chat(Events):
     EVENT_OUTPUT_REQUESTED = 'output_requested'
     EVENT_MESSAGES_UPDATED =  'messages_updated'
 
+    # Tokens that can terminate the chat, shared by all instances
+    TERMINATE_TOKENS = frozenset(('quit', 'q'))
+
     def __init__(self):
         """
         Initialize the chat instance.
 
         Attributes:
             terminate (bool): Flag to indicate whether the chat should be terminated.
-            terminate_tokens (list[str]): List of tokens that can terminate the chat.
+            terminate_tokens (frozenset[str]): Tokens that can terminate the chat.
             running_command (bool): Flag to indicate whether a command is currently running.
             waiting_for_response (bool): Flag to indicate whether the chat is waiting for a response.
             messages (list[dict]): The chat log, stored as a list of dictionaries with 'role' and 'content' keys.
@@ -75,8 +78,7 @@ class Chat(Events):
         """
         super().__init__()
         self.terminate = False
-        # List of tokens that can terminate the chat
-        self.terminate_tokens = [ 'quit', 'q' ]
+        self.terminate_tokens = Chat.TERMINATE_TOKENS
         self.running_command = False
         self.waiting_for_response = False
         self.messages = []
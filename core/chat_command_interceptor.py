@@ -14,6 +14,7 @@ class ChatCommandInterceptor:
         - chat (Chat): The chat object that this interceptor is attached to.
         - root_folder (str): The root folder where chat sessions are stored.
         - extra_commands (list): A list of custom commands that this interceptor handles.
+        - commands (dict): Built-in commands mapped to the handler that receives the command parts.
     """
 
     def __init__(self, chat: Chat, root_folder: str) -> None:
@@ -28,6 +29,11 @@ class ChatCommandInterceptor:
         self.root_folder = root_folder
         self.chat.add_event(Chat.EVENT_COMMAND_STARTED, self.run)
         self.extra_commands = []
+        self.commands = {
+            '/save': lambda parts: self.save_session(parts[1]),
+            '/load': lambda parts: self.load_session(parts[1]),
+            '/list': lambda parts: self.list_sessions(),
+        }
 
     def run(self, command_text: str) -> None:
         """
@@ -39,14 +45,9 @@ class ChatCommandInterceptor:
         parts = command_text.split()
         command = parts[0]
 
-        if command in ['/save', '/load', '/list']:
+        if handler := self.commands.get(command):
             # Handle save, load, or list commands
-            if command_text.startswith('/save'):
-                self.save_session(parts[1])
-            elif command_text.startswith('/load'):
-                self.load_session(parts[1])
-            elif command_text.startswith('/list'):
-                self.list_sessions()
+            handler(parts)
         elif command in self.extra_commands:
             # Handle custom commands
             if self.handled_extra_command(command_text):
@@ -64,10 +65,20 @@ class ChatCommandInterceptor:
             - filename (str): The name of the file to save the session to.
         """
         os.makedirs(self.root_folder, exist_ok=True)
+        filepath = os.path.join(self.root_folder, filename)
 
-        with open(os.path.join(self.root_folder, filename), 'w') as f:
-            json.dump(self.chat.messages, f)
-            pformat_text("=== Session saved ===", color=Color.YELLOW)
+        # write a temporary file and swap it in, so an existing session is never left half written
+        temp_filepath = filepath + ".tmp"
+        session_data = json.dumps(self.chat.messages)
+        try:
+            with open(temp_filepath, 'w') as f:
+                f.write(session_data)
+            os.replace(temp_filepath, filepath)
+        except BaseException:
+            # also on ctrl+c, a leftover temporary file would show up in list_sessions
+            if os.path.exists(temp_filepath): os.remove(temp_filepath)
+            raise
+        pformat_text("=== Session saved ===", color=Color.YELLOW)
 
     def load_session(self, filename: str) -> None:
         """
@@ -91,7 +102,8 @@ class ChatCommandInterceptor:
         """
         Lists all chat sessions stored in the root folder.
         """
-        files_list = [file for file in os.listdir(self.root_folder) if os.path.isfile(os.path.join(self.root_folder, file))]
+        with os.scandir(self.root_folder) as entries:
+            files_list = [entry.name for entry in entries if entry.is_file()]
         func.out("Chat sessions : ")
         for file in files_list:
             func.out(Color.PURPLE + " - " + file + Color.RESET)
\ No newline at end of file
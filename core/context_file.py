@@ -1,6 +1,5 @@
 import json
 import logging
-from os.path import exists
 from pathlib import Path
 
 
@@ -58,9 +58,8 @@ class Events:
         Returns:
             None
         """
-        if event_name in self.events:
-            for listener in self.events.get(event_name, []):
-                listener(data)
+        for listener in self.events.get(event_name, ()):
+            listener(data)
 
     def add_event(self, event_name: str, listener):
         """
@@ -76,6 +75,19 @@ class Events:
         self._register_event(event_name)
         self.events[event_name].append(listener)
 
+    def add_events(self, events: list):
+        """
+        Adds several listeners at once.
+        
+        Args:
+            events (list): A list of (event_name, listener) pairs to be added.
+        
+        Returns:
+            None
+        """
+        for event_name, listener in events:
+            self.add_event(event_name, listener)
+
     def remove_event(self, event_name: str, listener):
         """
         Removes a listener from an event.
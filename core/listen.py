@@ -1,9 +1,8 @@
 
-import threading
 import pyaudio
 import wave
 import time
-from core.command_executor import AsyncExecutor, ExecutorResult
+from core.command_executor import AsyncExecutor
 from color import Color
 
 FORMAT = pyaudio.paInt16  # Audio format (16-bit integer)
@@ -118,7 +118,7 @@ class BaseModel(Events):
         Returns:
             list: The updated list of messages.
         """
-        if self.ROLE_SYSTEM not in [obj['role'] for obj in messages]:
+        if not any(obj['role'] == self.ROLE_SYSTEM for obj in messages):
             messages.insert(0, BaseModel.create_message(BaseModel.ROLE_SYSTEM, self.system_prompt))
         return messages
 
@@ -5,7 +5,6 @@ The bot uses the Ollama library to generate responses to user input.
 """
 
 import ollama
-from core.events import Events
 from .base_llm import BaseModel, ModelParams
 
 
@@ -43,15 +42,21 @@ class OllamaModel( BaseModel, ModelParams):
         # load images into context
         if images is not None and len(images) > 0: new_messages.append(super().load_images(images))
 
+        # model defaults are kept as-is, only per call overrides build a new dict
+        llm_options = {**self.options.to_dict(), **options} if options else self.options.to_dict()
         response = self.model.chat(model=self.model_name, messages=new_messages,
-                                   stream=stream, options=self.options.to_dict())
+                                   stream=stream, options=llm_options)
         if stream:
+            # only keep the streamed text around if someone will receive it
+            content_parts = [] if self.events.get(self.STREAMING_FINISHED_EVENT) else None
             for chunks in response:
-                yield chunks['message']['content']
+                content = chunks['message']['content']
+                if content_parts is not None: content_parts.append(content)
+                yield content
                 if self.close_requested:
                     response.close()
                     self.close_requested = False
-            self.trigger(self.STREAMING_FINISHED_EVENT)
+            self.trigger(self.STREAMING_FINISHED_EVENT, "".join(content_parts or []))
 
         else:
             self.trigger(self.STREAMING_FINISHED_EVENT)
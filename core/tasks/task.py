@@ -21,10 +21,11 @@ class Task:
         self.previous_output = dict()
         
         self._running_llm : OllamaModel = None
+        self._output_file = None
 
     def load(self):
         t_pass: TaskPass = self.passes_list[self.pass_index]
-        self.previous_output[self.pass_index] = ""
+        self.previous_output[self.pass_index] = []
 
         # Load needed Files
         t_pass._context_files = list()
@@ -50,8 +51,11 @@ class Task:
         
 
     def llm_stream(self, token):
-        self.previous_output[self.pass_index] += token
-        self.add_output(content = token,filemode = func.FILE_MODE_APPEND)
+        self.previous_output[self.pass_index].append(token)
+        if self._output_file:
+            self._output_file.write(token)
+        else:
+            self.add_output(content = token,filemode = func.FILE_MODE_APPEND)
 
     def llm_finish_stream(self, data):
         self.add_output(content = data,filemode = func.FILE_MODE_APPEND)
@@ -81,9 +85,16 @@ class Task:
         self._running_llm = OllamaModel(model=self.model_name,system_prompt=self.system_message,host=host)
         
         func.log(f"{Color.BLUE}## {Color.RESET} Running pass {t_pass.name}") 
-        for token in self._running_llm.chat(messages=messages,options=llm_options):
-            self.llm_stream(token=token)
-            func.out(token,end="",flush=True)
+        # keep the pass output file open while streaming instead of reopening it per token
+        # line buffered like ask(), so a tail on the output file still sees whole lines while the pass runs
+        self._output_file = func.open_file(self.get_output_filename(), func.FILE_MODE_APPEND, buffering=1)
+        try:
+            for token in self._running_llm.chat(messages=messages,options=llm_options):
+                self.llm_stream(token=token)
+                func.out(token,end="",flush=True)
+        finally:
+            self._output_file.close()
+            self._output_file = None
         func.out(Color.GREEN)    
         func.log(f"Done {t_pass.name} {Color.BLUE}------------------------------------------------------------{Color.RESET} ") 
 
@@ -94,7 +105,7 @@ class Task:
 
         if self.pass_index > 0 and t_pass.use_previous_output:
             func.log(f"{Color.BLUE}## {Color.RESET} - Loading previous pass output") 
-            p_output = self.previous_output[self.pass_index-1]
+            p_output = "".join(self.previous_output[self.pass_index-1])
             messages.append( OllamaModel.create_message(OllamaModel.ROLE_USER, message=f"Previous output : \n\n{p_output}" ))
              
         if t_pass._context_files:
@@ -127,7 +138,6 @@ class EachFileTask(Task):
 
     def run_passes(self, llm_options={}) -> None:
         n_files = len(self.files)
-        name = self.name
         func.log(f"{Color.GREEN}## {Color.RESET} Found {n_files} '{self.extension}' files in {self.directory}") 
         
         file_index = 1
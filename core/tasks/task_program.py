@@ -1,25 +1,32 @@
 import json
 import argparse, logging
-from init import print_initial_info
 import functions as func
-from program import Program ,ProgramConfig
+from program import Program
 from color import Color
 from core.tasks import Task, TaskPass, EachFileTask, TaskType
 
 from pathlib import Path
 
+# default options for automated task passes, each task gets its own copy
+TASK_LLM_OPTIONS = {
+    'num_ctx': 16384,
+    'temperature':0.0,
+    'seed':16384
+}
+
 class AutomatedTask(Program):
+    # task classes that take extra "data" arguments, any other type runs as a plain Task
+    TASK_TYPES = {
+        TaskType.EACH_FILE: EachFileTask,
+    }
+
     def __init__(self, args_parser:argparse.ArgumentParser=None) -> None:
         super().__init__()
         
         func.clear_console()
         self._logger = logging.Logger(name=__file__,level=logging.INFO)
         self.arg_parser: argparse.ArgumentParser = args_parser or self._create_args_parser()
-        self.llm_options = {
-            'num_ctx': 16384,
-            'temperature':0.0,
-            'seed':16384
-        }
+        self.llm_options = dict(TASK_LLM_OPTIONS)
         self.init_program()
 
         
@@ -59,8 +66,9 @@ class AutomatedTask(Program):
         return task
 
     def __create_task_from_type(self,name,system_message,type,data=None):
-        if type == TaskType.EACH_FILE:
-            return EachFileTask(name=name,system_message=system_message,**data)
+        task_class = self.TASK_TYPES.get(type)
+        if task_class:
+            return task_class(name=name,system_message=system_message,**data)
         return Task(name=name,system_message=system_message)    
             
     def create_task_pass(self, json_pass_config:dict) -> None:
@@ -1,33 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
+from os import environ
+import re
 
-import ollama
-from chat import ChatRoles
+from core.chat import ChatRoles
 from core.llms.ollama_model import OllamaModel
 from color import Color, pformat_text
 import json
-import os
 
 
+# matches a "tool": or 'tool': key, the only messages worth asking the selector about
+TOOL_REQUEST_RE = re.compile(r"""["']tool["']\s*:""")
+
+TOOL_SELECTOR_TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates", "system", "tool_selector.md")
+
+
+@lru_cache(maxsize=1)
+def _tool_selector_prompt() -> str:
+    # the template ships with the program and never changes while it runs, read it once
+    with open(TOOL_SELECTOR_TEMPLATE, 'r', encoding="utf-8") as file:
+        return file.read()
 
 
 class ToolSelector(OllamaModel):
     
-    def __init__(self, model, config, system_prompt=None):
-        with  open(os.path.join(
-            config['SYSTEM_PROMPT_FOLDER'],
-            './prompt_templates/tool_selector.md'), 'r') as file:
-            system_prompt = file.read()
-        super().__init__(model, system_prompt)
+    def __init__(self, model, system_prompt=None, host=None):
+        super().__init__(model, system_prompt or _tool_selector_prompt(), host=host)
 
     def  check_tool_request(self,text):
-        if("'tool':" in text or '"tool":' in text):
-            pformat_text("Checking for tool request ...",Color.RED)
-            new_messages = self.check_system_prompt([{'role':ChatRoles.USER,'content':text}])
-            res = ollama.chat(model=self.model_name, messages=new_messages, stream=False) 
-            result = json.loads(res['message']['content'])
-        
-            return result['tool'] is not None
-        return False
+        # most messages carry no tool key, skip the model round trip for them
+        if not TOOL_REQUEST_RE.search(text): return False
+
+        pformat_text("Checking for tool request ...",Color.RED)
+        new_messages = self.check_system_prompt([{'role':ChatRoles.USER,'content':text}])
+        # self.model is the ollama.Client built by OllamaModel, it keeps its connection between checks
+        res = self.model.chat(model=self.model_name, messages=new_messages, stream=False)
+        result = json.loads(res['message']['content'])
+        return result['tool'] is not None
 
 class BaseTool:
     def __init__(self,tool, name,description, examples=None) -> None:
@@ -36,7 +46,7 @@ class BaseTool:
         self.description = description
         self.examples = examples
 
-    def run(data):
+    def run(self, data):
         raise NotImplementedError("Hey, don't forget to implement the run")
     
     def __repr__(self) -> str:
@@ -51,67 +61,74 @@ class FileLister(BaseTool):
 
     def __init__(self):
         super().__init__(
-            "list_dir"
+            "list_dir",
             "Directory Lister",
             "List all files and folder in a directory",
              "{'tool':'list_dir','data':'directory_to_get_files'}")
 
     def run(self, directory):
-        self.list_files(directory)
+        return self.list_files(directory)
 
-    def list_files(self, extension=None):
+    def list_files(self, directory, extension=None):
 
         if extension and not extension.startswith('.'):
 
             extension = '.' + extension
 
+        # scandir entries carry the file type from the directory listing, no stat per entry
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries
+                    if entry.is_file() and (not extension or entry.name.endswith(extension))]
 
-        files = []
-
-        for filename in os.listdir(self.directory):
 
-            if os.path.isfile(os.path.join(self.directory, filename)):
-
-                if not extension or filename.endswith(extension):
-
-                    files.append(filename)
-
-        return files
-
-
-import requests
-import json
-from os import environ
+# seconds to wait for the weather api before giving up
+WEATHER_REQUEST_TIMEOUT = 10
 
 class OpenWeatherAPI(BaseTool):
     def __init__(self, api_key=None):
         super().__init__(
-            "weather_search"
+            "weather_search",
             "Open Weather api",
             "gets weather forecast for current weather in any location",
             "{'tool':'weather_search','data':'location_to_check'}")
         self.api_key = api_key or environ.get("OPENWEATHER_API_KEY")
+        # requests is only needed by this tool, load it here instead of with the module
+        import requests
+        # keeps the connection to the api open between calls
+        self._session = requests.Session()
+        # a Session is not guaranteed to be thread safe, the concurrent forecast request keeps its own
+        self._forecast_session = requests.Session()
+        self._forecast_executor = ThreadPoolExecutor(max_workers=1)
 
     def run(self,city):
-        self.get_current_weather(city)
+        return self.get_current_weather(city)
         
-    def get_current_weather(self, city):
+    def get_current_weather(self, city, session=None):
         url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&units=metric&appid={self.api_key}"
-        response = requests.get(url)
-        data = json.loads(response.text)
-        return data
+        response = (session or self._session).get(url, timeout=WEATHER_REQUEST_TIMEOUT)
+        return response.json()
 
-    def get_forecast(self, city, days):
+    def get_forecast(self, city, days, session=None):
         url = f"http://api.openweathermap.org/data/2.5/forecast?q={city}&units=metric&appid={self.api_key}"
-        response = requests.get(url)
-        data = json.loads(response.text)
-        forecast_data = []
-        for i in range(len(data["list"])):
-            if i % 8 == 0:   # Get the forecast every 3 hours
-                forecast_data.append({
-                     "date": data["list"][i]["dt_txt"],
-                     "temperature": data["list"][i]["main"]["temp"],
-                     "condition": data["list"][i]["weather"][0]["description"]
-                 })
-        return forecast_data
-
+        response = (session or self._session).get(url, timeout=WEATHER_REQUEST_TIMEOUT)
+        data = response.json()
+        # entries come in 3 hour steps, every 8th one is the same hour on the next day
+        return [{
+                "date": entry["dt_txt"],
+                "temperature": entry["main"]["temp"],
+                "condition": entry["weather"][0]["description"]
+            } for entry in data["list"][::8]]
+
+    def get_weather_and_forecast(self, city):
+        """
+        Gets the current weather and the forecast for a city, running both requests at the same time.
+
+        Args:
+            city (str): The location to check.
+
+        Returns:
+            tuple: The current weather data and the forecast list.
+        """
+        # both calls only wait on the network, so the total is the slower call instead of the sum
+        forecast = self._forecast_executor.submit(self.get_forecast, city, None, self._forecast_session)
+        return self.get_current_weather(city), forecast.result()
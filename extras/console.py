@@ -31,10 +31,8 @@ class ConsoleChatReader:
         func.out(f"{color}{text} {Color.RESET} {colored_text}",flush=True, end="\n\n")
 
     def color_text(self, text:str):
-        colored_text = ""
-        for token in text.split(" "):
-            colored_text+=self.token_processor.process_token(token) + " "
-        return colored_text
+        process_token = self.token_processor.process_token
+        return "".join(process_token(token) + " " for token in text.split(" "))
 
 class ConsoleTokenFormatter:
     
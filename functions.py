@@ -1,11 +1,11 @@
 from color import Color, pformat_text
+from functools import lru_cache
 import os
 from pathlib import Path
 import sys
 
 from core.context_file import ContextFile
 from config import ProgramConfig, ProgramSetting
-from colorama import Fore, Style
 
 
 FILE_MODE_APPEND = "a"
@@ -76,6 +76,22 @@ def get_files(directory, extension=None) -> list[ContextFile]:
         return file_list
 
 
+@lru_cache(maxsize=256)
+def template_exists(filename) -> bool:
+    """
+    Checks if a template file exists, caching the answer for the rest of the session.
+    Only use it for read-only template files, files written by the program can appear later.
+
+    Args:
+        filename (str): The template filename to check.
+
+    Example:
+        >>> template_exists("/path/to/templates/system/code_expert.md")
+            # Returns True if the template exists
+    """
+    return os.path.exists(filename)
+
+
 def read_file(filename):
     """
     Reads the contents of a file and returns it as a string.
@@ -108,13 +124,30 @@ def write_to_file(filename, content, filemode=FILE_MODE_CREATE):
         >>> write_to_file("/path/to/file.txt", "Hello, World!")
             # Writes "Hello, World!" to the specified file
     """
+    with open_file(filename, filemode) as f:
+        f.write(content)
+        f.flush()
+
+
+def open_file(filename, filemode=FILE_MODE_CREATE, buffering=-1):
+    """
+    Opens a file for writing, creating its parent folders if needed.
+    Use it instead of write_to_file when writing many small chunks, so the file is opened only once.
+
+    Args:
+        filename (str): The name of the file to open.
+        file_mode (str): The mode in which to open the file. Defaults to "w" for overwrite.
+        buffering (int): Buffering policy passed to open(), 1 flushes on every new line. Defaults to -1.
+
+    Example:
+        >>> with open_file("/path/to/file.txt") as f:
+        ...     f.write("Hello, World!")
+    """
     file = Path(filename).resolve()
     os.makedirs(file.parent,exist_ok=True)
     # file.parent.mkdir(exist_ok=True)
 
-    with open(file, filemode) as f:
-        f.write(content)
-        f.flush()
+    return open(file, filemode, buffering=buffering)
 
 
 def format_execution_time(start_time, end_time):
@@ -132,6 +165,19 @@ def log(text, start_line="[ * ]", **kargs):
         print((f"{Color.BLUE}{start_line}{Color.RESET} ") + text, **kargs)
 
 
-def out(text, **kargs):
-    if ProgramConfig.current.get(ProgramSetting.PRINT_OUTPUT, False):
+def output_enabled() -> bool:
+    """
+    Tells if program output is printed, lets hot loops read the setting once and pass it to out().
+
+    Example:
+        >>> enabled = output_enabled()
+        >>> for token in tokens: out(token, enabled=enabled)
+    """
+    return ProgramConfig.current.get(ProgramSetting.PRINT_OUTPUT, False)
+
+
+def out(text, enabled=None, **kargs):
+    # callers in a loop pass the setting they already read, everyone else gets it looked up
+    if enabled is None: enabled = output_enabled()
+    if enabled:
         print(text, **kargs)
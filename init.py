@@ -4,7 +4,6 @@ just_fix_windows_console()
 from dotenv import load_dotenv
 load_dotenv()
 
-from time import time
 import readline
 import argparse
 
@@ -54,8 +53,7 @@ def print_initial_info(prog:Program) -> None:
    
     func.set_console_title("Ai assistant: " + prog.model_chat_name)
     
-    system_p_file :str = prog.config.get('SYSTEM_PROMPT_FILE').split("/")[-1].replace('.md','').replace('_'," ")
-    system_p_file = system_p_file.replace('.md','').replace('_'," ").capitalize()
+    system_p_file :str = prog.config.get('SYSTEM_PROMPT_FILE').split("/")[-1].removesuffix('.md').replace('_'," ").capitalize()
     
     func.out(Color.GREEN,end="")
     func.out(f"# Starting {Color.YELLOW}{ prog.model_chat_name }{Color.GREEN} assistant")
@@ -54,19 +54,22 @@ class Program:
         """
         Initializes the program with configuration settings.
         """
-        self.model_name :str = ProgramConfig.current.get("MODEL_NAME")
+        self.model_name, system_prompt_file, host, paths = ProgramConfig.current.get_many([
+            ProgramSetting.MODEL_NAME,
+            ProgramSetting.SYSTEM_PROMPT_FILE,
+            ProgramSetting.OLLAMA_HOST,
+            ProgramSetting.PATHS])
         self.model_chat_name :str = self.model_name.split(":")[0] 
         spliced_model_name = self.model_name.split(":")
         self.model_variant = spliced_model_name[1] if len(spliced_model_name) > 1 else None 
 
         self.system_prompt :str = None
-        with  open(ProgramConfig.current.get(ProgramSetting.SYSTEM_PROMPT_FILE,"config.json"), 'r') as file:
+        with  open(system_prompt_file or "config.json", 'r') as file:
             self.system_prompt = file.read()    
         
         self.chat  = Chat()
-        self.llm = OllamaModel( self.model_name, system_prompt=self.system_prompt , host=ProgramConfig.current.get(ProgramSetting.OLLAMA_HOST) )
+        self.llm = OllamaModel( self.model_name, system_prompt=self.system_prompt , host=host )
         self.init_model_params()
-        paths = ProgramConfig.current.get('PATHS')
         self.command_interceptor = ChatCommandInterceptor(self.chat, paths['CHAT_LOG'])
         self.active_executor:CommandExecutor = None
 
@@ -98,18 +101,18 @@ class Program:
                 started_response = True
                 
             new_token = self.process_token(text)
-            self.chat.current_message += text
             func.out(new_token, end="", flush=True)
 
     def llm_stream_finished(self, data):
         """
         Handles the finished event for the language model stream.
-        
+
         Args:
-            data (ExecutorResult): The result of the executor.
+            data (str): The full content streamed by the language model.
         """
         func.out("\n")
         self.clear_process_token()
+        self.chat.current_message = data or ""
         self.chat.chat_finished()
 
     def output_requested(self):
@@ -122,8 +125,10 @@ class Program:
         """
         Loads events for the chat and language model.
         """
-        self.chat.add_event(event_name=self.chat.EVENT_CHAT_SENT, listener=self.start_chat)
-        self.chat.add_event(event_name=self.chat.EVENT_OUTPUT_REQUESTED, listener=self.output_requested)
+        self.chat.add_events([
+            (self.chat.EVENT_CHAT_SENT, self.start_chat),
+            (self.chat.EVENT_OUTPUT_REQUESTED, self.output_requested),
+        ])
         self.llm.add_event(event_name=self.llm.STREAMING_FINISHED_EVENT,listener=self.llm_stream_finished)
 
     def load_config(self, args=None):
@@ -137,27 +142,37 @@ class Program:
         self.config = ProgramConfig.load()
         if args is None: return
           
+        # read the overrides once, parsers built elsewhere (e.g. automated tasks) may not define them all
+        model = getattr(args, "model", None)
+        system = getattr(args, "system", None)
+        system_file = getattr(args, "system_file", None)
+        print_log = getattr(args, "no_log", True)
+        print_output = getattr(args, "no_out", True)
+
          # override with arguments    
-        if args.model: ProgramConfig.current.set(key='MODEL_NAME', value=args.model)
+        if model: ProgramConfig.current.set(key='MODEL_NAME', value=model)
 
-        if args.system: 
+        if system: 
             system_templates_dir = ProgramConfig.current.get(ProgramSetting.PATHS , {}).get(ProgramSetting.SYSTEM_TEMPLATES)
             user_system_templates_dir = ProgramConfig.current.get(ProgramSetting.USER_PATHS , {}).get(ProgramSetting.SYSTEM_TEMPLATES)
 
-            filepath: str = os.path.join(  user_system_templates_dir, args.system.replace(".md","")+".md")            
-            if os.path.exists(filepath): 
-                ProgramConfig.current.set(ProgramSetting.SYSTEM_PROMPT_FILE, filepath) 
-            else: 
-                filepath: str = os.path.join(  system_templates_dir, args.system.replace(".md","")+".md")            
-                ProgramConfig.current.set(ProgramSetting.SYSTEM_PROMPT_FILE, filepath)
+            template_filename = system.removesuffix(".md")+".md"
+
+            filepath: str = os.path.join(  system_templates_dir, template_filename)
+            # an empty user folder would resolve the template against the working directory
+            if user_system_templates_dir:
+                user_filepath: str = os.path.join(  user_system_templates_dir, template_filename)
+                if func.template_exists(user_filepath): filepath = user_filepath
+            ProgramConfig.current.set(ProgramSetting.SYSTEM_PROMPT_FILE, filepath)
 
 
-        if args.system_file: 
-            filepath = args.system_file
+        if system_file: 
+            filepath = system_file
             if os.path.exists(filepath): ProgramConfig.current.set(ProgramSetting.SYSTEM_PROMPT_FILE, filepath) 
         
-        ProgramConfig.current.set(ProgramSetting.PRINT_LOG, args.no_log)
-        ProgramConfig.current.set(ProgramSetting.PRINT_OUTPUT, args.no_out)
+        # --no-log / --no-out default to True, only a passed flag changes the configured value
+        if not print_log: ProgramConfig.current.set(ProgramSetting.PRINT_LOG, False)
+        if not print_output: ProgramConfig.current.set(ProgramSetting.PRINT_OUTPUT, False)
       
             
     def start_chat_loop(self) -> None:
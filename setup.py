@@ -1,5 +1,3 @@
-import ollama
-from tqdm import tqdm
 from config import ProgramConfig, ProgramSetting
 from color import Color
 from core.llms.ollama_model import OllamaModel
@@ -35,6 +33,9 @@ class Setup:
           
 
     def __pull_model(self,model_name,ollama_inst):
+        # tqdm is only needed when a model has to be downloaded
+        from tqdm import tqdm
+
         # Initialize variables: current_digest and bars dictionary                                                                                                                  
         current_digest, bars = '', {}                                                                                                                                               
                                                                                                                                                                                     